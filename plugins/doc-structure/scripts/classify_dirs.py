@@ -16,22 +16,37 @@ Created by: k_terada
 import sys
 import os
 import json
+import re
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 
-# スキップするディレクトリ
-SKIP_DIRS = {
+# スキップするディレクトリ（不変なので frozenset でハッシュ照合する）
+SKIP_DIRS = frozenset({
     '.git', '.claude', '.github', '.vscode', '.idea',
     'node_modules', '__pycache__', '.tox', '.mypy_cache',
     'venv', '.venv', 'env', '.env',
     'dist', 'build', 'target', 'out',
     '.next', '.nuxt', '.svelte-kit',
     'vendor', 'Pods', '.gradle',
-}
+})
 
 # これらのファイルが存在するディレクトリはソースコードディレクトリと判断しスキップ
-SKIP_INDICATORS = {'package.json', 'Cargo.toml', 'go.mod', 'pom.xml', 'setup.py', 'pyproject.toml'}
+SKIP_INDICATORS = frozenset({
+    'package.json', 'Cargo.toml', 'go.mod', 'pom.xml', 'setup.py', 'pyproject.toml',
+})
+
+# README 類のみのディレクトリ判定に使うファイル名（小文字比較）
+README_ONLY_NAMES = frozenset({
+    'readme.md', 'changelog.md', 'contributing.md', 'license.md',
+    'code_of_conduct.md', 'security.md',
+})
+
+# front matter の 'key: value' 行（コメント行は除外、CRLF 対応）
+# bytes のままマッチし、デコードはヒットしたキー・値だけに絞る
+_FM_LINE_RE = re.compile(rb'(?m)^[ \t]*([^#\s:][^:\n]*?)[ \t]*:[ \t]*(.*?)[ \t\r]*$')
 
 
 def get_project_root(path=None):
@@ -57,103 +72,196 @@ def parse_args():
     return parser.parse_args()
 
 
-def find_md_dirs(project_root):
+def find_md_dirs(project_root, skip_prefixes=None):
     """
     Markdown ファイルを含むディレクトリを発見する（浅いスキャン）。
 
     .md ファイルが見つかったディレクトリの配下は探索しない。
     例: specs/ に .md があれば specs/login/requirements/ は探索されない。
 
+    skip_prefixes を渡すと該当ディレクトリは配下ごと探索しない。
+
     Returns:
         list of (relative_dir_path, md_file_count)
     """
     results = []
-    root = Path(project_root)
+    root_str = os.fspath(project_root)
     found_dirs = set()
-    visited_real = set()  # 循環検出用（realpath で追跡）
-
-    for dirpath, dirnames, filenames in os.walk(root, followlinks=True):
-        current = Path(dirpath)
-        real_path = current.resolve()
 
-        # シンボリックリンクの循環検出
-        if real_path in visited_real:
-            dirnames[:] = []
+    # 循環検出用（(st_dev, st_ino) で追跡）
+    # 循環は symlink 経由でしか起きないため、実ディレクトリは stat せず
+    # d_type だけで降下し、symlink の参照先のみ記録する
+    try:
+        st = os.stat(root_str)
+    except OSError:
+        return results
+    visited = {(st.st_dev, st.st_ino)}
+
+    stack = [root_str]
+    while stack:
+        dirpath = stack.pop()
+
+        # os.scandir で1パス列挙（DirEntry が d_type を再利用し stat を節約）
+        subdirs = []
+        filenames = []
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        # システムディレクトリ・隠しディレクトリを除外
+                        if entry.name in SKIP_DIRS or entry.name.startswith('.'):
+                            continue
+                        if entry.is_symlink():
+                            try:
+                                est = os.stat(entry.path)
+                            except OSError:
+                                continue
+                            key = (est.st_dev, est.st_ino)
+                            if key in visited:
+                                continue
+                            visited.add(key)
+                        subdirs.append(entry.path)
+                    else:
+                        filenames.append(entry.name)
+        except OSError:
             continue
-        visited_real.add(real_path)
-
-        rel = current.relative_to(root)
-        rel_str = str(rel)
 
-        # システムディレクトリ・隠しディレクトリを除外
-        dirnames[:] = [
-            d for d in dirnames
-            if d not in SKIP_DIRS
-            and not d.startswith('.')
-        ]
+        rel_str = os.path.relpath(dirpath, root_str)
 
         # ルートディレクトリ自体はスキップ
         if rel_str == '.':
+            stack.extend(subdirs)
             continue
 
-        # 祖先ディレクトリで既に .md が見つかっている場合はスキップ
-        if any(rel_str.startswith(found + '/') or rel_str == found for found in found_dirs):
-            dirnames[:] = []
+        # --skip 指定ディレクトリは配下ごと探索を打ち切る
+        if skip_prefixes and any(
+                rel_str == p or rel_str.startswith(p + '/') for p in skip_prefixes):
             continue
 
-        # ソースコードディレクトリはスキップ
-        if any((current / ind).exists() for ind in SKIP_INDICATORS):
+        # 祖先ディレクトリで既に .md が見つかっている場合はスキップ
+        # （found_dirs 全走査ではなく、自身と各祖先プレフィックスを O(深さ) 回照合）
+        if found_dirs:
+            prefix = rel_str
+            while prefix:
+                if prefix in found_dirs:
+                    break
+                cut = prefix.rfind('/')
+                prefix = prefix[:cut] if cut != -1 else ''
+            if prefix:
+                continue
+
+        # ソースコードディレクトリは配下ごとスキップ（探索を打ち切る）
+        # 列挙済みのファイル名と突き合わせるだけなので stat 不要
+        if not SKIP_INDICATORS.isdisjoint(filenames):
             continue
 
         # .md ファイルをカウント
-        md_files = [f for f in filenames if f.endswith('.md')]
-        if md_files:
-            results.append((rel_str, len(md_files)))
+        md_count = sum(1 for f in filenames if f.endswith('.md'))
+        if md_count:
+            results.append((rel_str, md_count))
             found_dirs.add(rel_str)
-            dirnames[:] = []  # 配下の探索を停止
+            # 配下の探索を停止（stack に積まない）
+        else:
+            stack.extend(subdirs)
 
     return results
 
 
-def is_readme_only(project_root, dir_path):
-    """README/CHANGELOG 等のみを含むディレクトリか判定する。"""
-    root = Path(project_root)
-    dir_full = root / dir_path
-    md_files = [f.name.lower() for f in dir_full.glob('*.md')]
-    skip_names = {'readme.md', 'changelog.md', 'contributing.md', 'license.md',
-                  'code_of_conduct.md', 'security.md'}
-    return all(f in skip_names for f in md_files)
+def _list_md_files(dir_full):
+    """ディレクトリ直下の .md ファイル名をソート済みで返す。
+
+    Path.glob と違い fnmatch や Path オブジェクト生成を伴わない。
+    ファイル名を返すので readme_only 判定にそのまま使える。
+    """
+    try:
+        with os.scandir(dir_full) as it:
+            return sorted(e.name for e in it
+                          if e.name.endswith('.md') and e.is_file())
+    except OSError:
+        return []
+
+
+def is_readme_only(project_root, dir_path, md_names=None):
+    """README/CHANGELOG 等のみを含むディレクトリか判定する。
+
+    md_names に .md ファイル名リストを渡すと再列挙を省略する。
+    """
+    if md_names is None:
+        # 列挙しながら判定し、README 類以外が見つかった時点で打ち切る
+        try:
+            with os.scandir(os.path.join(os.fspath(project_root), dir_path)) as it:
+                return all(e.name.lower() in README_ONLY_NAMES
+                           for e in it
+                           if e.name.endswith('.md') and e.is_file())
+        except OSError:
+            return True
+    return all(f.lower() in README_ONLY_NAMES for f in md_names)
 
 
 def extract_front_matter(filepath):
     """
     Markdown ファイルから YAML front matter を抽出する。
 
+    結果は (パス, mtime, サイズ) をキーにキャッシュされ、
+    未変更ファイルの再パースを省略する。
+
     Returns:
         dict or None
     """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read(4096)
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return _extract_front_matter_cached(os.fspath(filepath),
+                                        st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=4096)
+def _extract_front_matter_cached(filepath, mtime_ns, size):
+    """extract_front_matter の実体（キャッシュキーに mtime/size を含む）。"""
+    try:
+        with open(filepath, 'rb') as f:
+            head = f.read(4096)
     except (IOError, OSError):
         return None
 
-    if not content.startswith('---'):
+    # frontmatter がないファイルは UTF-8 デコードせずに判定して返す
+    if not head.startswith(b'---'):
         return None
 
-    end = content.find('---', 3)
+    end = head.find(b'---', 3)
     if end == -1:
         return None
 
-    fm_content = content[3:end]
-    result = {}
-    for line in fm_content.split('\n'):
-        line = line.strip()
-        if ':' in line and not line.startswith('#'):
-            key, _, val = line.partition(':')
-            result[key.strip()] = val.strip().strip('"\'')
-
-    return result
+    # 本文は一切デコードせず、マッチしたキーと値だけを str にする
+    return {m.group(1).decode('utf-8', errors='replace'):
+            m.group(2).strip(b'"\'').decode('utf-8', errors='replace')
+            for m in _FM_LINE_RE.finditer(head[3:end])}
+
+
+def _collect_dir_metadata(project_root, dir_path, md_count):
+    """1ディレクトリ分のメタデータを収集する（scan_directories のワーカー）。"""
+    dir_full = os.path.join(os.fspath(project_root), dir_path)
+
+    # .md ファイルの列挙は1回だけ行い、frontmatter 収集と
+    # readme_only 判定で共有する
+    md_names = _list_md_files(dir_full)
+
+    # frontmatter の doc_type 値を収集（生データ）
+    # 値は 'rule' / 'design' 等の小さな語彙なので intern して共有する
+    doc_type_values = []
+    for name in md_names:
+        fm = extract_front_matter(os.path.join(dir_full, name))
+        if fm and 'doc_type' in fm:
+            doc_type_values.append(sys.intern(fm['doc_type'].lower()))
+
+    return {
+        'dir': dir_path,
+        'md_count': md_count,
+        'readme_only': is_readme_only(project_root, dir_path, md_names=md_names),
+        'path_components': dir_path.replace('\\', '/').split('/'),
+        'frontmatter_doc_types': doc_type_values or None,
+    }
 
 
 def scan_directories(project_root, skip_prefixes=None):
@@ -164,44 +272,31 @@ def scan_directories(project_root, skip_prefixes=None):
     Returns:
         list[dict]: 各ディレクトリのメタデータ
     """
-    md_dirs = find_md_dirs(project_root)
+    # 除外は walker 側で枝刈りする（スキャン後のフィルタだと探索が無駄になる）
+    md_dirs = find_md_dirs(project_root, skip_prefixes)
 
-    if skip_prefixes:
-        md_dirs = [(d, c) for d, c in md_dirs if not any(
-            d == prefix or d.startswith(prefix + '/') for prefix in skip_prefixes
-        )]
+    if not md_dirs:
+        return []
 
-    results = []
-    root = Path(project_root)
-
-    for dir_path, md_count in md_dirs:
-        dir_full = root / dir_path
-
-        # frontmatter の doc_type 値を収集（生データ）
-        doc_type_values = []
-        for md_file in dir_full.glob('*.md'):
-            fm = extract_front_matter(md_file)
-            if fm and 'doc_type' in fm:
-                doc_type_values.append(fm['doc_type'].lower())
-
-        results.append({
-            'dir': dir_path,
-            'md_count': md_count,
-            'readme_only': is_readme_only(project_root, dir_path),
-            'path_components': list(Path(dir_path).parts),
-            'frontmatter_doc_types': doc_type_values or None,
-        })
-
-    return results
+    # ディレクトリ間に共有状態はなく I/O バウンドなのでスレッドで並列化する
+    max_workers = min(32, len(md_dirs), (os.cpu_count() or 4) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            lambda item: _collect_dir_metadata(project_root, item[0], item[1]),
+            md_dirs))
 
 
-def output_scan(project_root, directories):
-    """スキャン結果を JSON で出力する。"""
+def output_scan(project_root, directories, stream=None):
+    """スキャン結果を JSON で出力する（デフォルトは stdout）。"""
+    if stream is None:
+        stream = sys.stdout
     output = {
         'project_root': project_root,
         'directories': directories,
     }
-    print(json.dumps(output, indent=2, ensure_ascii=False))
+    # 整形済み文字列全体を組み立てず、ストリームへ逐次書き出す
+    json.dump(output, stream, indent=2, ensure_ascii=False)
+    stream.write('\n')
 
 
 def main():
@@ -12,7 +12,8 @@ Usage:
   python3 resolve_review_context.py [target1] [target2] ...
 
   target: ファイルパス（複数可）、ディレクトリパス、Feature名、または省略
-  フラグ（--codex, --claude, --auto-fix）は無視される
+  --pretty を付けると整形 JSON を出力（デフォルトはコンパクト形式）
+  その他のフラグ（--codex, --claude, --auto-fix）は無視される
 
 Output (JSON):
   {
@@ -28,22 +29,40 @@ Output (JSON):
   }
 """
 
-import glob
 import json
 import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
-# ソースコード拡張子（汎用）
-CODE_EXTENSIONS = {'.swift', '.kt', '.java', '.ts', '.tsx', '.js', '.jsx',
-                   '.py', '.go', '.rs', '.c', '.cpp', '.h', '.m', '.mm'}
+# PyYAML の C ローダーが使える環境では YAML パースを高速化する。
+# 無い環境でも標準ライブラリのみで動作する（手書きパーサーにフォールバック）。
+try:
+    from yaml import CSafeLoader as _YAML_C_LOADER, load as _yaml_load
+except ImportError:
+    _YAML_C_LOADER = None
+
+# 走査時にスキップするディレクトリ（classify_dirs.py の SKIP_DIRS と整合）
+SKIP_DIRS = frozenset({
+    '.git', '.claude', '.github', '.vscode', '.idea',
+    'node_modules', '__pycache__', '.tox', '.mypy_cache',
+    'venv', '.venv', 'env', '.env',
+    'dist', 'build', 'target', 'out',
+    '.next', '.nuxt', '.svelte-kit',
+    'vendor', 'Pods', '.gradle',
+})
+
+# ソースコード拡張子（汎用、ドットなしの小文字サフィックス）
+CODE_EXTENSIONS = frozenset({'swift', 'kt', 'java', 'ts', 'tsx', 'js', 'jsx',
+                             'py', 'go', 'rs', 'c', 'cpp', 'h', 'm', 'mm'})
 
 # generic 種別の基盤文書パターン（rules パスは doc_structure から動的取得）
 GENERIC_BASE_PATTERNS = [
     '.claude/skills/',
     '.claude/commands/',
 ]
-GENERIC_ROOT_FILES = {'CLAUDE.md', 'README.md'}
+GENERIC_ROOT_FILES = frozenset({'CLAUDE.md', 'README.md'})
 
 # specs doc_type → review type マッピング
 SPECS_REVIEW_TYPE_MAP = {
@@ -71,76 +90,128 @@ def _parse_flow_array(s):
     return [item.strip().strip('"\'') for item in inner.split(',') if item.strip()]
 
 
+def _normalize_doc_structure(data):
+    """yaml.load の結果を手書きパーサーと同じ形に正規化する"""
+    if not isinstance(data, dict) or 'version' not in data:
+        return None
+
+    result = {'version': str(data['version'])}
+    for category in ('specs', 'rules'):
+        if category not in data:
+            continue
+        result[category] = {}
+        cat = data[category]
+        if not isinstance(cat, dict):
+            continue
+        for doc_type_name, info in cat.items():
+            entry = {}
+            if isinstance(info, dict):
+                for field in ('paths', 'exclude'):
+                    if field in info:
+                        val = info[field]
+                        entry[field] = ([str(v) for v in val]
+                                        if isinstance(val, list) else [])
+                if 'description' in info:
+                    entry['description'] = str(info['description'])
+            result[category][doc_type_name] = entry
+    return result
+
+
 def _parse_doc_structure_yaml(filepath):
-    """.doc_structure.yaml 専用パーサー（インデントベース状態マシン）"""
+    """.doc_structure.yaml 専用パーサー
+
+    PyYAML の C ローダーがあればそちらでパースし（純 Python 比で大幅に
+    高速）、無ければ従来のインデントベース状態マシンで読む。
+    """
+    if _YAML_C_LOADER is not None:
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                return _normalize_doc_structure(_yaml_load(f, Loader=_YAML_C_LOADER))
+        except Exception:
+            pass  # 不正な YAML 等は手書きパーサーに委ねる
+
     result = {}
-    current_category = None  # 'specs' or 'rules'
-    current_doc_type = None
+    current_category_dict = None  # result['specs'] / result['rules'] のエイリアス
+    current_type_info = None      # 現在の doc_type 辞書のエイリアス
     current_field = None
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        for line in f:
-            stripped = line.rstrip()
-            if not stripped or stripped.lstrip().startswith('#'):
-                continue
-
-            indent = len(line) - len(line.lstrip())
-            content = stripped.strip()
+    # 小さな設定ファイルなので一括で読み、C 実装の splitlines で分割する
+    lines = Path(filepath).read_text(encoding='utf-8').splitlines()
 
-            # indent=0: トップレベルキー (version, specs, rules)
-            if indent == 0 and ':' in content:
-                key, val = _split_kv(content)
-                if key == 'version':
-                    result['version'] = val.strip('"\'')
-                elif key in ('specs', 'rules'):
-                    current_category = key
-                    result.setdefault(current_category, {})
-                    current_doc_type = None
-                    current_field = None
-                continue
+    for line in lines:
+        stripped = line.rstrip()
+        if not stripped or stripped.lstrip().startswith('#'):
+            continue
 
-            # indent=2: doc_type キー
-            if indent == 2 and current_category and ':' in content:
-                key, _ = _split_kv(content)
-                current_doc_type = key
-                result[current_category].setdefault(current_doc_type, {})
+        indent = len(line) - len(line.lstrip())
+        content = stripped.strip()
+
+        # indent=0: トップレベルキー (version, specs, rules)
+        if indent == 0 and ':' in content:
+            key, val = _split_kv(content)
+            if key == 'version':
+                result['version'] = val.strip('"\'')
+            elif key in ('specs', 'rules'):
+                current_category_dict = result.setdefault(key, {})
+                current_type_info = None
                 current_field = None
-                continue
+            continue
 
-            # indent=4: フィールド (paths, exclude, description)
-            if indent == 4 and current_category and current_doc_type:
-                if ':' in content and not content.startswith('- '):
-                    key, val = _split_kv(content)
-                    current_field = key
-                    if key in ('paths', 'exclude'):
-                        if val.startswith('['):
-                            result[current_category][current_doc_type][key] = _parse_flow_array(val)
-                            current_field = None
-                        else:
-                            result[current_category][current_doc_type][key] = []
-                    elif key == 'description':
-                        result[current_category][current_doc_type]['description'] = val.strip('"\'')
-                elif content.startswith('- ') and current_field in ('paths', 'exclude'):
-                    item_val = content[2:].strip().strip('"\'')
-                    result[current_category][current_doc_type].setdefault(current_field, []).append(item_val)
-                continue
+        # indent=2: doc_type キー
+        if indent == 2 and current_category_dict is not None and ':' in content:
+            key, _ = _split_kv(content)
+            current_type_info = current_category_dict.setdefault(key, {})
+            current_field = None
+            continue
 
-            # indent=6: ブロック配列要素
-            if indent == 6 and current_field in ('paths', 'exclude') and content.startswith('- '):
+        # indent=4: フィールド (paths, exclude, description)
+        if indent == 4 and current_type_info is not None:
+            if ':' in content and not content.startswith('- '):
+                key, val = _split_kv(content)
+                current_field = key
+                if key in ('paths', 'exclude'):
+                    if val.startswith('['):
+                        current_type_info[key] = _parse_flow_array(val)
+                        current_field = None
+                    else:
+                        current_type_info[key] = []
+                elif key == 'description':
+                    current_type_info['description'] = val.strip('"\'')
+            elif content.startswith('- ') and current_field in ('paths', 'exclude'):
                 item_val = content[2:].strip().strip('"\'')
-                result[current_category][current_doc_type].setdefault(current_field, []).append(item_val)
-                continue
+                current_type_info.setdefault(current_field, []).append(item_val)
+            continue
+
+        # indent=6: ブロック配列要素
+        if indent == 6 and current_field in ('paths', 'exclude') and content.startswith('- '):
+            item_val = content[2:].strip().strip('"\'')
+            current_type_info.setdefault(current_field, []).append(item_val)
+            continue
 
     return result if result.get('version') else None
 
 
+@lru_cache(maxsize=32)
+def _parse_doc_structure_cached(path_str, mtime_ns, size):
+    """parse_doc_structure のキャッシュ実体（キーに mtime/size を含む）。"""
+    return _parse_doc_structure_yaml(path_str)
+
+
 def parse_doc_structure(project_root):
-    """.doc_structure.yaml を読み込み。存在しなければ None を返す"""
+    """.doc_structure.yaml を読み込み。存在しなければ None を返す
+
+    結果は (パス, mtime, サイズ) をキーにキャッシュされ、ファイルが
+    変わらない限り再パースしない。返る dict は共有されるので
+    呼び出し側で変更しないこと。
+    """
     filepath = project_root / '.doc_structure.yaml'
-    if not filepath.exists():
+    try:
+        st = filepath.stat()
+    except OSError:
         return None
+
     try:
-        return _parse_doc_structure_yaml(filepath)
+        return _parse_doc_structure_cached(str(filepath), st.st_mtime_ns, st.st_size)
     except Exception:
         return None
 
@@ -149,8 +220,12 @@ def parse_doc_structure(project_root):
 # doc_type → review type マッピング
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
 def _doc_type_to_review_type(category, doc_type_name):
-    """doc_structure の category + doc_type_name からレビュー種別を返す"""
+    """doc_structure の category + doc_type_name からレビュー種別を返す
+
+    純粋関数なのでキャッシュし、分類ループ内の呼び出しを辞書参照1回にする。
+    """
     if category == 'specs':
         return SPECS_REVIEW_TYPE_MAP.get(doc_type_name, 'generic')
     elif category == 'rules':
@@ -162,42 +237,52 @@ def _doc_type_to_review_type(category, doc_type_name):
 # Exclude 判定
 # ---------------------------------------------------------------------------
 
+def _is_excluded_parts(parts, exclude_list):
+    """分割済みコンポーネント集合に対する exclude 判定（ホットパス用）"""
+    if not exclude_list:
+        return False
+    return not parts.isdisjoint(exclude_list)
+
+
 def _is_excluded(path_str, exclude_list):
     """パス内のいずれかのコンポーネントが exclude リストにマッチするか判定"""
     if not exclude_list:
         return False
-    parts = path_str.replace('\\', '/').split('/')
-    return any(part in exclude_list for part in parts)
+    # コンポーネント側を set 化すれば components × excludes の
+    # 総当たりがハッシュ照合1回になる（exclude_list は list でも set でも可）
+    return _is_excluded_parts(
+        frozenset(path_str.replace('\\', '/').split('/')), exclude_list)
 
 
 def _get_all_excludes(doc_structure, category):
-    """カテゴリ内の全 exclude 名を集約"""
+    """カテゴリ内の全 exclude 名を集約（不変な frozenset で返す）"""
     if not doc_structure:
-        return set()
+        return frozenset()
     excludes = set()
     for type_info in doc_structure.get(category, {}).values():
         excludes.update(type_info.get('exclude', []))
-    return excludes
+    return frozenset(excludes)
 
 
 # ---------------------------------------------------------------------------
 # パスマッチング・種別判定
 # ---------------------------------------------------------------------------
 
-def _path_matches_pattern(file_path, pattern):
-    """ファイルパスがパターン配下にあるか判定。glob * に対応"""
-    pattern_parts = pattern.rstrip('/').split('/')
-    path_parts = file_path.replace('\\', '/').split('/')
+@lru_cache(maxsize=None)
+def _compiled_pattern(pattern):
+    """パターンを正規表現に1回だけコンパイルする（パターン数は高々数十）
 
-    if len(path_parts) < len(pattern_parts):
-        return False
+    * は1コンポーネント（[^/]+）、それ以外はリテラル一致。
+    末尾は次の区切りか文字列終端を要求し、部分一致を防ぐ。
+    """
+    parts = pattern.rstrip('/').split('/')
+    regex = '/'.join('[^/]+' if p == '*' else re.escape(p) for p in parts)
+    return re.compile(regex + '(?:/|$)')
 
-    for i, p_part in enumerate(pattern_parts):
-        if p_part == '*':
-            continue
-        if path_parts[i] != p_part:
-            return False
-    return True
+
+def _path_matches_pattern(file_path, pattern):
+    """ファイルパスがパターン配下にあるか判定。glob * に対応"""
+    return _compiled_pattern(pattern).match(file_path.replace('\\', '/')) is not None
 
 
 def detect_type_from_doc_structure(path_str, doc_structure):
@@ -206,12 +291,14 @@ def detect_type_from_doc_structure(path_str, doc_structure):
         return None
 
     normalized = path_str.replace('\\', '/')
+    # exclude 判定用のコンポーネント集合はループの外で1回だけ作る
+    parts = frozenset(normalized.split('/'))
     for category in ('specs', 'rules'):
         for doc_type_name, type_info in doc_structure.get(category, {}).items():
             exclude_list = type_info.get('exclude', [])
             for declared_path in type_info.get('paths', []):
                 if _path_matches_pattern(normalized, declared_path):
-                    if not _is_excluded(normalized, exclude_list):
+                    if not _is_excluded_parts(parts, exclude_list):
                         return _doc_type_to_review_type(category, doc_type_name)
     return None
 
@@ -261,22 +348,17 @@ def detect_features_from_doc_structure(project_root, doc_structure):
             if not prefix_dir.is_dir():
                 continue
 
-            # * の後のサフィックスパーツ
-            suffix_parts = parts[star_idx + 1:]
-
-            for entry in prefix_dir.iterdir():
-                if not entry.is_dir() or entry.name.startswith('.'):
-                    continue
-                if entry.name in exclude_list:
-                    continue
-                if suffix_parts:
-                    check_path = entry
-                    for sp in suffix_parts:
-                        check_path = check_path / sp
-                    if check_path.is_dir():
+            # * の後のサフィックスパーツ（結合は entry ループの外で1回だけ）
+            suffix_rel = os.path.join(*parts[star_idx + 1:]) if parts[star_idx + 1:] else ''
+
+            with os.scandir(prefix_dir) as it:
+                for entry in it:
+                    if not entry.is_dir() or entry.name.startswith('.'):
+                        continue
+                    if entry.name in exclude_list:
+                        continue
+                    if not suffix_rel or os.path.isdir(os.path.join(entry.path, suffix_rel)):
                         features.add(entry.name)
-                else:
-                    features.add(entry.name)
 
     return sorted(features)
 
@@ -288,19 +370,41 @@ def detect_features_from_doc_structure(project_root, doc_structure):
 def parse_args():
     """引数を解析（フラグと対象を分離）"""
     targets = []
+    pretty = False
     for arg in sys.argv[1:]:
-        if arg.startswith('--'):
+        if arg == '--pretty':
+            pretty = True
+        elif arg.startswith('--'):
             continue
-        targets.append(arg)
-    return targets
+        else:
+            targets.append(arg)
+    return targets, pretty
+
+
+def _emit_json(obj, pretty=False):
+    """結果 JSON を stdout へ書き出す。
+
+    デフォルトはコンパクト形式を bytes で直接書き出す（ツール連携向け）。
+    --pretty 指定時のみ indent=2 で整形する。
+    """
+    if pretty:
+        sys.stdout.write(json.dumps(obj, ensure_ascii=False, indent=2) + '\n')
+    else:
+        data = json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+        sys.stdout.buffer.write(data.encode('utf-8') + b'\n')
 
 
 def find_project_root():
     """プロジェクトルートを検出"""
     current = Path.cwd()
     for _ in range(10):
-        if (current / ".git").exists() or (current / ".claude").exists():
-            return current
+        # 階層ごとに scandir 1回で複数センチネルをまとめて判定
+        try:
+            with os.scandir(current) as it:
+                if any(e.name in ('.git', '.claude') for e in it):
+                    return current
+        except OSError:
+            pass
         parent = current.parent
         if parent == current:
             break
@@ -324,7 +428,8 @@ def _detect_generic_type(path_str, doc_structure=None):
             if not _is_excluded(path_str, rules_excludes):
                 return "generic"
 
-    filename = Path(path_str).name
+    # ルート直下のみ対象なのでパス全体の split は不要（rpartition で末尾だけ取る）
+    filename = path_str.rstrip('/').rpartition('/')[2]
     if filename in GENERIC_ROOT_FILES and '/' not in path_str.rstrip('/'):
         return "generic"
     return None
@@ -333,8 +438,8 @@ def _detect_generic_type(path_str, doc_structure=None):
 def detect_type_from_path(path_str, doc_structure, project_root):
     """パスから種別を判定"""
     # 1. コードファイル判定（拡張子ベース）
-    _, ext = os.path.splitext(path_str)
-    if ext.lower() in CODE_EXTENSIONS:
+    _, sep, ext = path_str.rpartition('.')
+    if sep and ext.lower() in CODE_EXTENSIONS:
         return "code"
 
     # 2. .doc_structure.yaml パスマッチ
@@ -350,27 +455,61 @@ def detect_type_from_path(path_str, doc_structure, project_root):
     return None
 
 
+def _walk_classify(root_dir):
+    """配下を1回の走査でコード / Markdown ファイルに分類する。
+
+    glob の拡張子別リカーシブ走査（拡張子数 + 1 回のツリー走査）を
+    os.scandir による1パスに置き換える。隠しエントリは glob と同様に除外。
+    """
+    code_files = []
+    md_files = []
+    stack = [str(root_dir)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith('.'):
+                        continue
+                    if entry.is_dir():
+                        if name not in SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif name.endswith('.md'):
+                        md_files.append(entry.path)
+                    elif '.' in name and name.rpartition('.')[2].lower() in CODE_EXTENSIONS:
+                        code_files.append(entry.path)
+        except OSError:
+            continue
+    return code_files, md_files
+
+
+def _relativize(files, project_root):
+    """project_root からの相対パスに変換する（固定プレフィックスの切り落とし）"""
+    prefix = str(project_root).rstrip(os.sep) + os.sep
+    plen = len(prefix)
+    return [f[plen:] if f.startswith(prefix) else f for f in files]
+
+
 def detect_type_from_dir(dir_path, doc_structure, project_root):
     """ディレクトリ内のファイルから種別を判定"""
     dir_p = project_root / dir_path
     if not dir_p.is_dir():
         return None, []
 
-    code_files = []
-    for ext in CODE_EXTENSIONS:
-        code_files.extend(glob.glob(str(dir_p / '**' / f'*{ext}'), recursive=True))
-
-    md_files = sorted(glob.glob(str(dir_p / '**' / '*.md'), recursive=True))
+    code_files, md_files = _walk_classify(dir_p)
 
+    # 相対化してから1回だけ in-place ソートする（絶対パスでの事前ソートは不要）
     if code_files:
         # コード+md 混在（src/ に README.md がある等）も code として扱う
-        rel_files = [str(Path(f).relative_to(project_root)) for f in code_files]
-        return "code", sorted(rel_files)
+        rel_files = _relativize(code_files, project_root)
+        rel_files.sort()
+        return "code", rel_files
     elif md_files:
-        first_rel = str(Path(md_files[0]).relative_to(project_root))
-        review_type = detect_type_from_path(first_rel, doc_structure, project_root)
-        rel_files = [str(Path(f).relative_to(project_root)) for f in md_files]
-        return review_type, sorted(rel_files)
+        rel_files = _relativize(md_files, project_root)
+        rel_files.sort()
+        review_type = detect_type_from_path(rel_files[0], doc_structure, project_root)
+        return review_type, rel_files
 
     return None, []
 
@@ -379,6 +518,36 @@ def detect_type_from_dir(dir_path, doc_structure, project_root):
 # Feature 解決
 # ---------------------------------------------------------------------------
 
+# _dir_contains_md の結果キャッシュ（複数パターンからの同一ディレクトリ再判定を省略）
+_has_md_cache = {}
+
+
+def _dir_contains_md(root_dir):
+    """配下のどこかに .md ファイルがあるか、最初の1件で打ち切って判定する"""
+    key = str(root_dir)
+    cached = _has_md_cache.get(key)
+    if cached is not None:
+        return cached
+
+    found = False
+    stack = [key]
+    while stack and not found:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        if entry.name not in SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith('.md'):
+                        found = True
+                        break
+        except OSError:
+            continue
+    _has_md_cache[key] = found
+    return found
+
+
 def find_feature_subdirs(project_root, doc_structure, feature):
     """Feature 内で存在する種別サブディレクトリを検出（doc_structure ベース）"""
     available = []
@@ -396,17 +565,46 @@ def find_feature_subdirs(project_root, doc_structure, feature):
             # パターン中の * を feature 名に置換して存在確認
             concrete = path_pattern.replace('*', feature, 1)
             concrete_dir = project_root / concrete.rstrip('/')
-            if concrete_dir.is_dir() and any(concrete_dir.rglob('*.md')):
+            if concrete_dir.is_dir() and _dir_contains_md(concrete_dir):
                 if review_type not in available:
                     available.append(review_type)
+                # この doc_type の種別は確定したので残りパターンは見ない
+                break
     return available
 
 
+def _walk_md(root_str):
+    """配下の .md ファイルを収集する（glob の '**/*.md' 展開の置き換え）。
+
+    glob と同様に隠しエントリは除外し、加えて SKIP_DIRS 配下は降下しない。
+    """
+    md_files = []
+    stack = [root_str]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith('.'):
+                        continue
+                    if entry.is_dir():
+                        if name not in SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif name.endswith('.md'):
+                        md_files.append(entry.path)
+        except OSError:
+            continue
+    return md_files
+
+
 def find_target_files(project_root, doc_structure, feature, review_type):
     """Feature + 種別からファイル一覧を取得（doc_structure ベース）"""
     if not doc_structure:
         return []
 
+    root_str = str(project_root)
+
     for doc_type_name, type_info in doc_structure.get('specs', {}).items():
         if _doc_type_to_review_type('specs', doc_type_name) != review_type:
             continue
@@ -415,13 +613,12 @@ def find_target_files(project_root, doc_structure, feature, review_type):
             if '*' not in path_pattern:
                 continue
             concrete = path_pattern.replace('*', feature, 1)
-            pattern = str(project_root / concrete.rstrip('/') / '**' / '*.md')
-            files = sorted(glob.glob(pattern, recursive=True))
+            concrete_dir = os.path.join(root_str, concrete.rstrip('/'))
+            rel_files = sorted(_relativize(_walk_md(concrete_dir), project_root))
             # exclude フィルタ
-            files = [f for f in files if not _is_excluded(
-                str(Path(f).relative_to(project_root)), exclude_list)]
-            if files:
-                return [str(Path(f).relative_to(project_root)) for f in files]
+            rel_files = [f for f in rel_files if not _is_excluded(f, exclude_list)]
+            if rel_files:
+                return rel_files
     return []
 
 
@@ -528,7 +725,7 @@ def _resolve_multiple_targets(targets, doc_structure, project_root, result):
 # ---------------------------------------------------------------------------
 
 def main():
-    targets = parse_args()
+    targets, pretty = parse_args()
 
     project_root = find_project_root()
     os.chdir(project_root)
@@ -539,7 +736,7 @@ def main():
 
     if not has_doc_structure:
         # .doc_structure.yaml がなければエラー
-        print(json.dumps({
+        _emit_json({
             "status": "error",
             "has_doc_structure": False,
             "type": None,
@@ -547,7 +744,7 @@ def main():
             "features": [],
             "questions": [],
             "error": ".doc_structure.yaml が見つかりません。/doc-structure:init-doc-structure を実行して作成してください。"
-        }, ensure_ascii=False, indent=2))
+        }, pretty)
         return
 
     features = detect_features_from_doc_structure(project_root, doc_structure)
@@ -587,7 +784,7 @@ def main():
     if result["questions"]:
         result["status"] = "needs_input"
 
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+    _emit_json(result, pretty)
 
 
 if __name__ == "__main__":
@@ -16,21 +16,21 @@ Usage:
     python3 format_path.py --shell-func
 """
 
+import functools
 import os
 import sys
 import subprocess
 
 
+@functools.lru_cache(maxsize=1)
 def get_home_dir():
-    """Get home directory path."""
+    """Get home directory path (cached; the env/pwd lookup runs once)."""
     return os.path.expanduser("~")
 
 
-def get_git_root(path):
-    """Get the git repository root for the given path."""
-    check_dir = path if os.path.isdir(path) else os.path.dirname(path)
-    if not check_dir:
-        check_dir = "."
+@functools.lru_cache(maxsize=256)
+def _git_root_for_dir(check_dir):
+    """Run git rev-parse once per (canonicalized) directory."""
     try:
         result = subprocess.run(
             ["git", "-C", check_dir, "rev-parse", "--show-toplevel"],
@@ -43,6 +43,18 @@ def get_git_root(path):
     return None
 
 
+def get_git_root(path):
+    """Get the git repository root for the given path.
+
+    Results are cached per containing directory so formatting many
+    paths forks git only once per directory.
+    """
+    check_dir = path if os.path.isdir(path) else os.path.dirname(path)
+    if not check_dir:
+        check_dir = "."
+    return _git_root_for_dir(os.path.realpath(check_dir))
+
+
 def replace_home(path, home=None):
     """Replace home directory prefix with ~."""
     if home is None:
@@ -82,19 +94,24 @@ def truncate_middle(path, max_len):
     if len(parts) <= 3:
         return path
 
-    # Keep first part and last 2 parts, collapse middle
+    # Keep first part, collapse middle, keep as many tail parts as fit
     head = parts[0]
-    tail = "/".join(parts[-2:])
     ellipsis = "\u2026"  # …
 
-    # Try removing middle parts until it fits
-    for i in range(1, len(parts) - 2):
-        candidate = head + "/" + ellipsis + "/" + "/".join(parts[-(len(parts) - 1 - i):])
-        if len(candidate) <= max_len:
-            return candidate
+    # Length budget for the joined tail after "head/…/"
+    budget = max_len - len(head) - 3
+
+    # Grow the tail from the right while it still fits (2 parts minimum)
+    count = 2
+    tail_len = len(parts[-1]) + 1 + len(parts[-2])
+    while count < len(parts) - 2 and tail_len <= budget:
+        next_len = tail_len + 1 + len(parts[-(count + 1)])
+        if next_len > budget:
+            break
+        tail_len = next_len
+        count += 1
 
-    # Minimum: head/…/last_two
-    return head + "/" + ellipsis + "/" + tail
+    return head + "/" + ellipsis + "/" + "/".join(parts[-count:])
 
 
 def to_git_relative(path):
@@ -195,8 +212,9 @@ def main():
         print("Error: No paths specified", file=sys.stderr)
         sys.exit(1)
 
-    for p in paths:
-        print(format_path(p, truncate=truncate, git_root=git_root))
+    # Batch the results into a single write instead of one print per path
+    out = [format_path(p, truncate=truncate, git_root=git_root) for p in paths]
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
@@ -16,7 +16,6 @@ import shutil
 import sys
 import tempfile
 import unittest
-from contextlib import redirect_stdout
 from pathlib import Path
 
 # テスト対象モジュールへのパスを追加
@@ -35,13 +34,22 @@ from classify_dirs import (
 
 
 class _FsTestCase(unittest.TestCase):
-    """ファイルシステムを使うテストの基底クラス"""
+    """ファイルシステムを使うテストの基底クラス
 
-    def setUp(self):
-        self.tmpdir = Path(tempfile.mkdtemp())
+    mkdtemp/rmtree はクラスごとに1回だけ行い、各テストは共有ディレクトリ
+    配下のサブディレクトリで隔離する（テストごとの rmtree を省略）。
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls._base_dir = Path(tempfile.mkdtemp())
 
-    def tearDown(self):
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._base_dir, ignore_errors=True)
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp(dir=self._base_dir))
 
     def _write_file(self, rel_path, content=''):
         p = self.tmpdir / rel_path
@@ -329,8 +337,7 @@ class TestOutputScan(_FsTestCase):
 
     def _capture(self, project_root, directories):
         buf = io.StringIO()
-        with redirect_stdout(buf):
-            output_scan(project_root, directories)
+        output_scan(project_root, directories, stream=buf)
         return buf.getvalue()
 
     def test_valid_json(self):
@@ -116,6 +116,25 @@ rules:
 """
 
 
+# テンプレート YAML のパース結果キャッシュ（書き出し・再パースを1回に抑える）
+_parsed_template_cache = {}
+
+
+def _parse_template(yaml_content):
+    """テンプレート YAML を一度だけパースして共有する（結果は読み取り専用）"""
+    ds = _parsed_template_cache.get(yaml_content)
+    if ds is None:
+        fd, path = tempfile.mkstemp(suffix='.yaml')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(yaml_content)
+            ds = _parse_doc_structure_yaml(path)
+        finally:
+            os.unlink(path)
+        _parsed_template_cache[yaml_content] = ds
+    return ds
+
+
 class _YamlFileTestCase(unittest.TestCase):
     """YAML ファイルを tmpdir に書き出すヘルパー付きの基底クラス"""
 
@@ -365,12 +384,11 @@ class TestDocTypeToReviewType(unittest.TestCase):
         self.assertIsNone(_doc_type_to_review_type('other', 'rule'))
 
 
-class TestDetectTypeFromDocStructure(_YamlFileTestCase):
+class TestDetectTypeFromDocStructure(unittest.TestCase):
     """detect_type_from_doc_structure のテスト"""
 
     def _get_ds(self, yaml_content=YAML_WITH_EXCLUDE):
-        path = self._write_yaml(yaml_content)
-        return _parse_doc_structure_yaml(path)
+        return _parse_template(yaml_content)
 
     def test_normal_path_requirement(self):
         ds = self._get_ds()
@@ -425,12 +443,11 @@ class TestDetectTypeFromDocStructure(_YamlFileTestCase):
             detect_type_from_doc_structure('specs/login/requirements/req.md', None))
 
 
-class TestDetectGenericType(_YamlFileTestCase):
+class TestDetectGenericType(unittest.TestCase):
     """_detect_generic_type のテスト"""
 
     def _get_ds(self, yaml_content=YAML_MIXED_EXCLUDE):
-        path = self._write_yaml(yaml_content)
-        return _parse_doc_structure_yaml(path)
+        return _parse_template(yaml_content)
 
     def test_rules_path(self):
         ds = self._get_ds(YAML_WITH_EXCLUDE)
@@ -463,26 +480,23 @@ class TestDetectGenericType(_YamlFileTestCase):
         self.assertEqual(_detect_generic_type('rules/coding.md'), 'generic')
 
 
-class TestGetRulesAndSpecsPaths(_YamlFileTestCase):
+class TestGetRulesAndSpecsPaths(unittest.TestCase):
     """get_rules_paths / get_specs_paths_by_type のテスト"""
 
     def test_get_rules_paths(self):
-        path = self._write_yaml(YAML_FLAT)
-        ds = _parse_doc_structure_yaml(path)
+        ds = _parse_template(YAML_FLAT)
         self.assertEqual(get_rules_paths(ds), ['rules/'])
 
     def test_get_rules_paths_none(self):
         self.assertEqual(get_rules_paths(None), [])
 
     def test_get_specs_paths_requirement(self):
-        path = self._write_yaml(YAML_FLAT)
-        ds = _parse_doc_structure_yaml(path)
+        ds = _parse_template(YAML_FLAT)
         self.assertEqual(get_specs_paths_by_type(ds, 'requirement'),
                          ['specs/requirements/'])
 
     def test_get_specs_paths_design(self):
-        path = self._write_yaml(YAML_FLAT)
-        ds = _parse_doc_structure_yaml(path)
+        ds = _parse_template(YAML_FLAT)
         self.assertEqual(get_specs_paths_by_type(ds, 'design'),
                          ['specs/design/'])
 
@@ -664,8 +678,7 @@ class TestDetectTypeFromPath(_YamlFileTestCase):
     """detect_type_from_path の統合テスト"""
 
     def _get_ds(self, yaml_content=YAML_WITH_EXCLUDE):
-        path = self._write_yaml(yaml_content)
-        return _parse_doc_structure_yaml(path)
+        return _parse_template(yaml_content)
 
     def test_code_by_extension(self):
         ds = self._get_ds()
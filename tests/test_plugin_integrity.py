@@ -13,37 +13,88 @@ SKILL.md の frontmatter 検証、相互参照チェック、参照ファイル
 import json
 import os
 import re
+import sys
+import tempfile
 import unittest
+from functools import lru_cache
 from pathlib import Path
 
 # リポジトリルート
 REPO_ROOT = Path(__file__).resolve().parents[1]
 PLUGINS_DIR = REPO_ROOT / 'plugins'
 
+# パーサー整合性テスト用に resolve_review_context をインポート可能にする
+_SCRIPTS_DIR = str(PLUGINS_DIR / 'kaizen' / 'skills' / 'review' / 'scripts')
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
 
-def _read_json(path):
-    with open(path, 'r', encoding='utf-8') as f:
+from resolve_review_context import _parse_doc_structure_yaml
+
+# /kaizen:fix-staged, /doc-structure:where 等の /plugin:skill 形式参照
+_SKILL_REF_RE = re.compile(r'/(\w[\w-]*):(\w[\w-]*)')
+
+# セマンティックバージョニング形式 (X.Y.Z)
+_SEMVER_RE = re.compile(r'\d+\.\d+\.\d+')
+
+
+@lru_cache(maxsize=None)
+def _read_json_cached(path_str):
+    with open(path_str, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
+def _read_json(path):
+    """JSON を読み込む。同一ファイルの再読み込みはキャッシュで省略する。
+
+    返る dict はテスト間で共有されるので変更しないこと。
+    """
+    return _read_json_cached(os.fspath(path))
+
+
+@lru_cache(maxsize=1)
+def _collect_skill_mds():
+    """plugins/ 配下の SKILL.md を1回の走査で収集する。
+
+    複数のテストクラスが同じ rglob を繰り返さないよう共有する。
+    Returns:
+        tuple of (path_str, plugin_name, skill_dir_name)
+    """
+    skills = []
+    plugins_str = str(PLUGINS_DIR)
+    for root, dirs, files in os.walk(plugins_str):
+        dirs[:] = [d for d in dirs if not d.startswith('.')]
+        if 'SKILL.md' in files:
+            rel_parts = os.path.relpath(root, plugins_str).split(os.sep)
+            skills.append((os.path.join(root, 'SKILL.md'),
+                           rel_parts[0], rel_parts[-1]))
+    skills.sort()
+    return tuple(skills)
+
+
+@lru_cache(maxsize=None)
 def _parse_skill_frontmatter(skill_path):
-    """SKILL.md の YAML frontmatter を簡易パース"""
-    with open(skill_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    """SKILL.md の YAML frontmatter を簡易パース
 
-    if not content.startswith('---'):
-        return None
-
-    end = content.find('---', 3)
-    if end == -1:
-        return None
+    閉じ '---' で読み込みを打ち切るので本文サイズに影響されない。
+    結果はパスごとにキャッシュされ、テストクラス間で共有される。
+    """
+    fm_lines = []
+    with open(skill_path, 'r', encoding='utf-8') as f:
+        if f.readline().rstrip() != '---':
+            return None
+        for line in f:
+            if line.rstrip() == '---':
+                break
+            fm_lines.append(line)
+        else:
+            # 閉じ --- がない
+            return None
 
-    fm_text = content[3:end]
     result = {}
     current_key = None
     current_value_lines = []
 
-    for line in fm_text.split('\n'):
+    for line in fm_lines:
         stripped = line.strip()
         if not stripped or stripped.startswith('#'):
             continue
@@ -84,8 +135,9 @@ def _parse_skill_frontmatter(skill_path):
 class TestMarketplaceJson(unittest.TestCase):
     """marketplace.json の構造テスト"""
 
-    def setUp(self):
-        self.mp = _read_json(REPO_ROOT / '.claude-plugin' / 'marketplace.json')
+    @classmethod
+    def setUpClass(cls):
+        cls.mp = _read_json(REPO_ROOT / '.claude-plugin' / 'marketplace.json')
 
     def test_has_schema(self):
         self.assertIn('$schema', self.mp)
@@ -111,9 +163,18 @@ class TestMarketplaceJson(unittest.TestCase):
 
     def test_plugin_source_paths_exist(self):
         """source パスが実際に存在する"""
+        # plugins/ 直下は scandir 1回で列挙し、プラグインごとの stat を省く
+        with os.scandir(PLUGINS_DIR) as it:
+            plugin_dirs = {e.name for e in it if e.is_dir()}
         for plugin in self.mp['plugins']:
-            source = REPO_ROOT / plugin['source']
-            self.assertTrue(source.is_dir(),
+            source = plugin['source'].replace('\\', '/').rstrip('/')
+            parent, _, leaf = source.rpartition('/')
+            if parent.lstrip('./') == 'plugins':
+                exists = leaf in plugin_dirs
+            else:
+                # plugins/ 直下以外のレイアウトは従来どおり個別に確認
+                exists = (REPO_ROOT / plugin['source']).is_dir()
+            self.assertTrue(exists,
                             f"プラグイン '{plugin['name']}' の source '{plugin['source']}' が存在しない")
 
     def test_plugin_names_unique(self):
@@ -123,8 +184,9 @@ class TestMarketplaceJson(unittest.TestCase):
     def test_version_format(self):
         """バージョンがセマンティックバージョニング形式"""
         for plugin in self.mp['plugins']:
-            self.assertRegex(plugin['version'], r'^\d+\.\d+\.\d+$',
-                             f"'{plugin['name']}' のバージョン '{plugin['version']}' が不正")
+            self.assertIsNotNone(
+                _SEMVER_RE.fullmatch(plugin['version']),
+                f"'{plugin['name']}' のバージョン '{plugin['version']}' が不正")
 
 
 # =========================================================================
@@ -134,8 +196,18 @@ class TestMarketplaceJson(unittest.TestCase):
 class TestPluginJsonFiles(unittest.TestCase):
     """各プラグインの plugin.json テスト"""
 
-    def setUp(self):
-        self.mp = _read_json(REPO_ROOT / '.claude-plugin' / 'marketplace.json')
+    @classmethod
+    def setUpClass(cls):
+        cls.mp = _read_json(REPO_ROOT / '.claude-plugin' / 'marketplace.json')
+        # plugin.json はクラスで1回だけ読み、各テストで共有する
+        cls.plugin_jsons = []
+        for mp_plugin in cls.mp['plugins']:
+            pj_path = REPO_ROOT / mp_plugin['source'] / '.claude-plugin' / 'plugin.json'
+            try:
+                cls.plugin_jsons.append((mp_plugin, _read_json(pj_path)))
+            except OSError:
+                # 存在しない plugin.json は test_plugin_json_exists が検出する
+                continue
 
     def test_plugin_json_exists(self):
         """各プラグインに .claude-plugin/plugin.json が存在する"""
@@ -147,38 +219,34 @@ class TestPluginJsonFiles(unittest.TestCase):
 
     def test_version_consistency(self):
         """marketplace.json と plugin.json のバージョンが一致"""
-        for mp_plugin in self.mp['plugins']:
-            plugin_dir = REPO_ROOT / mp_plugin['source']
-            pj = _read_json(plugin_dir / '.claude-plugin' / 'plugin.json')
-            self.assertEqual(mp_plugin['version'], pj['version'],
-                             f"'{mp_plugin['name']}' のバージョン不一致: "
-                             f"marketplace={mp_plugin['version']} vs plugin={pj['version']}")
+        for mp_plugin, pj in self.plugin_jsons:
+            with self.subTest(plugin=mp_plugin['name']):
+                self.assertEqual(mp_plugin['version'], pj['version'],
+                                 f"'{mp_plugin['name']}' のバージョン不一致: "
+                                 f"marketplace={mp_plugin['version']} vs plugin={pj['version']}")
 
     def test_name_consistency(self):
         """marketplace.json と plugin.json の名前が一致"""
-        for mp_plugin in self.mp['plugins']:
-            plugin_dir = REPO_ROOT / mp_plugin['source']
-            pj = _read_json(plugin_dir / '.claude-plugin' / 'plugin.json')
-            self.assertEqual(mp_plugin['name'], pj['name'],
-                             f"名前不一致: marketplace={mp_plugin['name']} vs plugin={pj['name']}")
+        for mp_plugin, pj in self.plugin_jsons:
+            with self.subTest(plugin=mp_plugin['name']):
+                self.assertEqual(mp_plugin['name'], pj['name'],
+                                 f"名前不一致: marketplace={mp_plugin['name']} vs plugin={pj['name']}")
 
     def test_plugin_json_required_fields(self):
         """plugin.json に必須フィールドがある"""
         required = {'name', 'description', 'version'}
-        for mp_plugin in self.mp['plugins']:
-            plugin_dir = REPO_ROOT / mp_plugin['source']
-            pj = _read_json(plugin_dir / '.claude-plugin' / 'plugin.json')
-            for field in required:
-                self.assertIn(field, pj,
-                              f"'{mp_plugin['name']}' の plugin.json に '{field}' がない")
+        for mp_plugin, pj in self.plugin_jsons:
+            with self.subTest(plugin=mp_plugin['name']):
+                for field in required:
+                    self.assertIn(field, pj,
+                                  f"'{mp_plugin['name']}' の plugin.json に '{field}' がない")
 
     def test_license_present(self):
         """plugin.json に license がある"""
-        for mp_plugin in self.mp['plugins']:
-            plugin_dir = REPO_ROOT / mp_plugin['source']
-            pj = _read_json(plugin_dir / '.claude-plugin' / 'plugin.json')
-            self.assertIn('license', pj,
-                          f"'{mp_plugin['name']}' に license がない")
+        for mp_plugin, pj in self.plugin_jsons:
+            with self.subTest(plugin=mp_plugin['name']):
+                self.assertIn('license', pj,
+                              f"'{mp_plugin['name']}' に license がない")
 
 
 # =========================================================================
@@ -192,12 +260,10 @@ class TestSkillMdFiles(unittest.TestCase):
     def setUpClass(cls):
         """全 SKILL.md ファイルを収集"""
         cls.skills = []
-        for skill_md in PLUGINS_DIR.rglob('SKILL.md'):
-            plugin_name = skill_md.relative_to(PLUGINS_DIR).parts[0]
-            skill_name = skill_md.parent.name
-            fm = _parse_skill_frontmatter(skill_md)
+        for path_str, plugin_name, skill_name in _collect_skill_mds():
+            fm = _parse_skill_frontmatter(path_str)
             cls.skills.append({
-                'path': skill_md,
+                'path': path_str,
                 'plugin': plugin_name,
                 'dir_name': skill_name,
                 'frontmatter': fm,
@@ -262,19 +328,14 @@ class TestSkillCrossReferences(unittest.TestCase):
         """全 SKILL.md の内容を読み込み"""
         cls.skill_contents = {}
         cls.skill_names = set()
-        for skill_md in PLUGINS_DIR.rglob('SKILL.md'):
-            plugin_name = skill_md.relative_to(PLUGINS_DIR).parts[0]
-            skill_dir_name = skill_md.parent.name
+        for path_str, plugin_name, skill_dir_name in _collect_skill_mds():
             full_name = f'{plugin_name}:{skill_dir_name}'
             cls.skill_names.add(full_name)
-            cls.skill_contents[full_name] = skill_md.read_text(encoding='utf-8')
+            cls.skill_contents[full_name] = Path(path_str).read_text(encoding='utf-8')
 
     def _find_skill_references(self, content):
         """SKILL.md 内の /plugin:skill 形式の参照を抽出"""
-        # /kaizen:fix-staged, /doc-structure:where 等
-        pattern = r'/(\w[\w-]*):(\w[\w-]*)'
-        matches = re.findall(pattern, content)
-        return [(plugin, skill) for plugin, skill in matches]
+        return _SKILL_REF_RE.findall(content)
 
     def test_internal_references_valid(self):
         """内部プラグインへの参照先が存在する"""
@@ -320,17 +381,18 @@ class TestReferencedFilesExist(unittest.TestCase):
 
     def test_skill_directories_have_skill_md(self):
         """skills/ 配下の全ディレクトリに SKILL.md がある"""
-        for plugin_dir in PLUGINS_DIR.iterdir():
-            if not plugin_dir.is_dir():
-                continue
-            skills_dir = plugin_dir / 'skills'
-            if not skills_dir.is_dir():
+        # iterdir + is_dir の stat を避け、scandir の d_type で判定する
+        with os.scandir(PLUGINS_DIR) as it:
+            plugin_dirs = [e.path for e in it if e.is_dir()]
+        for plugin_dir in plugin_dirs:
+            try:
+                with os.scandir(os.path.join(plugin_dir, 'skills')) as it:
+                    skill_dirs = [e.path for e in it if e.is_dir()]
+            except OSError:
                 continue
-            for skill_dir in skills_dir.iterdir():
-                if not skill_dir.is_dir():
-                    continue
-                skill_md = skill_dir / 'SKILL.md'
-                self.assertTrue(skill_md.is_file(),
+            for skill_dir in skill_dirs:
+                skill_md = os.path.join(skill_dir, 'SKILL.md')
+                self.assertTrue(os.path.isfile(skill_md),
                                 f"Skill ディレクトリ '{skill_dir}' に SKILL.md がない")
 
 
@@ -344,6 +406,12 @@ class TestSchemaConsistency(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         cls.format_doc = (REPO_ROOT / 'docs' / 'doc_structure_format.md').read_text(encoding='utf-8')
+        cls._tmpdir_ctx = tempfile.TemporaryDirectory()
+        cls.tmpdir = cls._tmpdir_ctx.name
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmpdir_ctx.cleanup()
 
     def test_format_doc_mentions_exclude(self):
         """仕様書に exclude が記載されている"""
@@ -367,11 +435,6 @@ class TestSchemaConsistency(unittest.TestCase):
 
     def test_parser_supports_all_documented_fields(self):
         """パーサーが仕様書に記載された全フィールドを処理できる"""
-        import sys
-        sys.path.insert(0, str(PLUGINS_DIR / 'kaizen' / 'skills' / 'review' / 'scripts'))
-        from resolve_review_context import _parse_doc_structure_yaml
-        import tempfile
-
         # 全フィールドを含む YAML
         yaml_content = '''\
 version: "1.0"
@@ -387,23 +450,18 @@ rules:
     paths: [rules/]
     description: "開発ルール"
 '''
-        tmpdir = tempfile.mkdtemp()
-        try:
-            yaml_file = os.path.join(tmpdir, '.doc_structure.yaml')
-            with open(yaml_file, 'w') as f:
-                f.write(yaml_content)
-            result = _parse_doc_structure_yaml(yaml_file)
-
-            self.assertIsNotNone(result)
-            self.assertEqual(result['version'], '1.0')
-            self.assertIn('paths', result['specs']['requirement'])
-            self.assertIn('exclude', result['specs']['requirement'])
-            self.assertIn('description', result['specs']['requirement'])
-            self.assertIn('paths', result['rules']['rule'])
-            self.assertIn('description', result['rules']['rule'])
-        finally:
-            import shutil
-            shutil.rmtree(tmpdir, ignore_errors=True)
+        yaml_file = os.path.join(self.tmpdir, '.doc_structure.yaml')
+        with open(yaml_file, 'w') as f:
+            f.write(yaml_content)
+        result = _parse_doc_structure_yaml(yaml_file)
+
+        self.assertIsNotNone(result)
+        self.assertEqual(result['version'], '1.0')
+        self.assertIn('paths', result['specs']['requirement'])
+        self.assertIn('exclude', result['specs']['requirement'])
+        self.assertIn('description', result['specs']['requirement'])
+        self.assertIn('paths', result['rules']['rule'])
+        self.assertIn('description', result['rules']['rule'])
 
 
 # =========================================================================
@@ -415,39 +473,31 @@ class TestReadmeConsistency(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.readme = (REPO_ROOT / 'README.md').read_text(encoding='utf-8')
+        readme = (REPO_ROOT / 'README.md').read_text(encoding='utf-8')
+        # 名前・バージョン照合はトークン集合への membership で行う
+        # （プラグインごとの全文スキャンを避け、部分一致の誤ヒットも防ぐ）
+        cls.readme_tokens = set(re.findall(r'[\w.\-:]+', readme))
         cls.mp = _read_json(REPO_ROOT / '.claude-plugin' / 'marketplace.json')
 
     def test_all_plugins_listed_in_readme(self):
         """全プラグインが README に記載されている"""
         for plugin in self.mp['plugins']:
-            self.assertIn(plugin['name'], self.readme,
+            self.assertIn(plugin['name'], self.readme_tokens,
                           f"プラグイン '{plugin['name']}' が README に記載されていない")
 
     def test_versions_in_readme(self):
         """README 内のバージョンが marketplace と一致"""
         for plugin in self.mp['plugins']:
-            self.assertIn(plugin['version'], self.readme,
+            self.assertIn(plugin['version'], self.readme_tokens,
                           f"'{plugin['name']}' v{plugin['version']} が README にない")
 
     def test_skill_table_completeness(self):
         """README の Skills テーブルに全 Skill が含まれている"""
-        for plugin_dir in PLUGINS_DIR.iterdir():
-            if not plugin_dir.is_dir():
-                continue
-            skills_dir = plugin_dir / 'skills'
-            if not skills_dir.is_dir():
-                continue
-            for skill_dir in skills_dir.iterdir():
-                if not skill_dir.is_dir():
-                    continue
-                skill_md = skill_dir / 'SKILL.md'
-                if not skill_md.is_file():
-                    continue
-                fm = _parse_skill_frontmatter(skill_md)
-                if fm and fm.get('name'):
-                    self.assertIn(fm['name'], self.readme,
-                                  f"Skill '{fm['name']}' が README に記載されていない")
+        for path_str, _plugin_name, _skill_name in _collect_skill_mds():
+            fm = _parse_skill_frontmatter(path_str)
+            if fm and fm.get('name'):
+                self.assertIn(fm['name'], self.readme_tokens,
+                              f"Skill '{fm['name']}' が README に記載されていない")
 
 
 if __name__ == '__main__':